@@ -2,10 +2,20 @@ import streamlit as st
 import sys
 import os
 import json
+import hashlib
 from datetime import datetime
 # Add src to python path so we can import the engine from anywhere
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 from uk_smb_engine.agents.translator_engine import MasterInvestorOrchestrator
+from uk_smb_engine.schemas.models import BusinessType
+from uk_smb_engine.pipeline import parse_amount
+from uk_smb_engine.jobs import ChecklistCache
+
+# Finished checklists kept in memory, oldest evicted first
+MAX_CACHED_CHECKLISTS = 32
+CHECKLIST_ITEMS = 50
+# Seconds between progress redraws while a statement is labeled
+POLL_INTERVAL = 0.2
 def save_optional_data(email, name, industry, diagnosis_data):
     """Save opt-in data for future personalization"""
     if not email:  # Only save if user opted in
@@ -25,6 +35,16 @@ def save_optional_data(email, name, industry, diagnosis_data):
     if "user_insights" not in st.session_state:
         st.session_state.user_insights = []
     st.session_state.user_insights.append(data_entry)
+@st.cache_resource
+def checklist_cache():
+    """Finished and in-flight statement checklists keyed by (file hash, business type), shared across reruns and sessions"""
+    return ChecklistCache(max_entries=MAX_CACHED_CHECKLISTS)
+
+def render_tag_tally(tags, rows):
+    lines = [f"**{rows:,} transactions labeled**"]
+    for tag, count in sorted(tags.items(), key=lambda kv: -kv[1]):
+        lines.append(f"- `{tag}` — {count:,}")
+    return "\n".join(lines)
 # Set Page Config
 st.set_page_config(page_title="SMB Investor Brain", page_icon="🧠", layout="centered")
 # Initialize Session State
@@ -51,106 +71,169 @@ st.markdown("""
 # --- HEADER ---
 st.title("🧠 The Digital Business Investor")
 st.markdown("### Get an investor-grade diagnosis of your business in 2 minutes.")
-# --- STEP 1: INTAKE (The 7 Diagnostic Questions) ---
-if st.session_state["step"] == "triage":
-    st.markdown("## 🏥 The Business Physical")
-    st.write("We need 7 numbers to diagnose your business stage. Be honest - I'm a machine, I don't judge.")
+intake_tab, statement_tab = st.tabs(["🏥 Business Physical", "📂 Bank Statement"])
+with intake_tab:
+    # --- STEP 1: INTAKE (The 7 Diagnostic Questions) ---
+    if st.session_state["step"] == "triage":
+        st.markdown("## 🏥 The Business Physical")
+        st.write("We need 7 numbers to diagnose your business stage. Be honest - I'm a machine, I don't judge.")
     
-    with st.form("intake_form"):
-        col1, col2 = st.columns(2)
+        with st.form("intake_form"):
+            col1, col2 = st.columns(2)
         
-        with col1:
-            revenue = st.text_input("1. Annual Revenue ($)", help="e.g. 1000000")
-            margin = st.slider("2. Net Profit Margin (%)", -20, 50, 10, help="What do you keep after everything?")
-            cac = st.text_input("3. Cost to Acquire Customer ($)", help="How much marketing spend to get 1 sale?")
-            ltv = st.text_input("4. Customer Lifetime Value ($)", help="How much does one customer pay you in total over years?")
-        with col2:
-            offer_price = st.text_input("5. Price of Core Offer ($)", help="What is the price of your main product/service?")
-            upsell_rate = st.slider("6. Upsell / Retainer Conversion (%)", 0, 100, 15, help="What % of customers buy your next thing?")
-            bottleneck = st.selectbox(
-                "7. What feels broken?",
-                ["Running out of cash (Survival)", "Sales are flat (Stagnation)", "Chaotic / No Systems (Operations)", "Marketing is expensive (Funnel)", "I need to scale (Growth)"]
-            )
+            with col1:
+                revenue = st.text_input("1. Annual Revenue ($)", help="e.g. 1000000")
+                margin = st.slider("2. Net Profit Margin (%)", -20, 50, 10, help="What do you keep after everything?")
+                cac = st.text_input("3. Cost to Acquire Customer ($)", help="How much marketing spend to get 1 sale?")
+                ltv = st.text_input("4. Customer Lifetime Value ($)", help="How much does one customer pay you in total over years?")
+            with col2:
+                offer_price = st.text_input("5. Price of Core Offer ($)", help="What is the price of your main product/service?")
+                upsell_rate = st.slider("6. Upsell / Retainer Conversion (%)", 0, 100, 15, help="What % of customers buy your next thing?")
+                bottleneck = st.selectbox(
+                    "7. What feels broken?",
+                    ["Running out of cash (Survival)", "Sales are flat (Stagnation)", "Chaotic / No Systems (Operations)", "Marketing is expensive (Funnel)", "I need to scale (Growth)"]
+                )
         
-        submitted = st.form_submit_button("Run Diagnosis 🚀")
+            submitted = st.form_submit_button("Run Diagnosis 🚀")
         
-        if submitted:
-            try:
-                def start_clean(val):
-                    if not val: return 0.0
-                    return float(val.replace(',', '').replace('$', '').replace('£', '').strip())
-                answers = {
-                    "revenue": start_clean(revenue),
-                    "profit_margin": margin / 100.0,
-                    "cac": start_clean(cac),
-                    "ltv": start_clean(ltv),
-                    "offer_price": start_clean(offer_price),
-                    "upsell_rate": upsell_rate / 100.0,
-                    "bottleneck": bottleneck.split(" (")[0],
-                    "net_profit": start_clean(revenue) * (margin / 100.0)
-                }
+            if submitted:
+                try:
+                    def start_clean(val):
+                        if not val: return 0.0
+                        return parse_amount(val)
+                    answers = {
+                        "revenue": start_clean(revenue),
+                        "profit_margin": margin / 100.0,
+                        "cac": start_clean(cac),
+                        "ltv": start_clean(ltv),
+                        "offer_price": start_clean(offer_price),
+                        "upsell_rate": upsell_rate / 100.0,
+                        "bottleneck": bottleneck.split(" (")[0],
+                        "net_profit": start_clean(revenue) * (margin / 100.0)
+                    }
                 
-                # Special logic
-                if "Growth" in bottleneck:
-                    answers["user_intent"] = "open_new_location"
-                elif "Funnel" in bottleneck:
-                    answers["lead_source"] = "cold_traffic"
+                    # Special logic
+                    if "Growth" in bottleneck:
+                        answers["user_intent"] = "open_new_location"
+                    elif "Funnel" in bottleneck:
+                        answers["lead_source"] = "cold_traffic"
                 
-                st.session_state["answers"] = answers
-                st.session_state["headache"] = answers["bottleneck"]
-                st.session_state["step"] = "results"
-                st.rerun()
-            except ValueError:
-                st.error("Please enter valid numbers.")
-# --- STEP 3: RESULTS ---
-elif st.session_state["step"] == "results":
-    if st.button("← Back to Questions"):
-        st.session_state["step"] = "triage"
-        st.rerun()
-    brain = st.session_state["brain"]
-    result = brain.run_diagnosis(
-        st.session_state["headache"], 
-        st.session_state["answers"],
-        st.session_state.get("profile", {})
-    )
+                    st.session_state["answers"] = answers
+                    st.session_state["headache"] = answers["bottleneck"]
+                    st.session_state["step"] = "results"
+                    st.rerun()
+                except ValueError:
+                    st.error("Please enter valid numbers.")
+    # --- STEP 3: RESULTS ---
+    elif st.session_state["step"] == "results":
+        if st.button("← Back to Questions"):
+            st.session_state["step"] = "triage"
+            st.rerun()
+        brain = st.session_state["brain"]
+        result = brain.run_diagnosis(
+            st.session_state["headache"], 
+            st.session_state["answers"],
+            st.session_state.get("profile", {})
+        )
     
-    st.markdown("## 📊 Your Investor Scorecard")
+        st.markdown("## 📊 Your Investor Scorecard")
     
-    cols = st.columns(len(result.scorecard))
-    for i, (metric, value) in enumerate(result.scorecard.items()):
-        cols[i].metric(metric, value)
+        cols = st.columns(len(result.scorecard))
+        for i, (metric, value) in enumerate(result.scorecard.items()):
+            cols[i].metric(metric, value)
         
-    st.markdown("---")
+        st.markdown("---")
     
-    st.markdown("## 🔍 Strategic Insights")
-    for insight in result.insights:
-        if "🦄" in insight:
-             st.success(insight)
-        elif "🛑" in insight:
-             st.error(insight)
-        else:
-             st.warning(insight)
-        st.write("")
-    st.markdown("## 🚀 Your 90-Day Action Plan")
-    for step in result.action_plan:
-        st.write(step)
+        st.markdown("## 🔍 Strategic Insights")
+        for insight in result.insights:
+            if "🦄" in insight:
+                 st.success(insight)
+            elif "🛑" in insight:
+                 st.error(insight)
+            else:
+                 st.warning(insight)
+            st.write("")
+        st.markdown("## 🚀 Your 90-Day Action Plan")
+        for step in result.action_plan:
+            st.write(step)
     
-    st.markdown("---")
-    st.markdown("### 💌 Want to save your report?")
+        st.markdown("---")
+        st.markdown("### 💌 Want to save your report?")
     
-    with st.expander("Email me my report (Optional)"):
-        st.write("We'll send you this analysis plus a weekly growth tip.")
-        name = st.text_input("Name")
-        email = st.text_input("Email")
-        industry = st.selectbox("Industry", ["Retail", "Service", "Trade", "Tech", "Other"])
+        with st.expander("Email me my report (Optional)"):
+            st.write("We'll send you this analysis plus a weekly growth tip.")
+            name = st.text_input("Name")
+            email = st.text_input("Email")
+            industry = st.selectbox("Industry", ["Retail", "Service", "Trade", "Tech", "Other"])
         
-        if st.button("Send Report"):
-            if email:
-                save_optional_data(email, name, industry, result)
-                st.success(f"Report sent to {email}! (Data Saved)")
+            if st.button("Send Report"):
+                if email:
+                    save_optional_data(email, name, industry, result)
+                    st.success(f"Report sent to {email}! (Data Saved)")
+                else:
+                    st.error("Please enter an email.")
+        if st.button("Start Over"):
+            st.session_state["step"] = "triage"
+            st.session_state["answers"] = {}
+            st.rerun()
+
+# --- BANK STATEMENT UPLOAD (Labeler -> Translator -> Diagnostician -> Architect) ---
+with statement_tab:
+    st.markdown("## 📂 Statement Check")
+    st.write("Upload a bank statement CSV with `date`, `description` and `amount` columns. Optional: `type`, `category`.")
+
+    business_type = st.selectbox(
+        "What kind of business is this?",
+        list(BusinessType),
+        format_func=lambda bt: bt.value.title(),
+    )
+    uploaded = st.file_uploader("Bank statement (CSV)", type=["csv"])
+
+    if uploaded is not None:
+        with uploaded.getbuffer() as buf:
+            file_hash = hashlib.sha256(buf).hexdigest()
+        cache_key = (file_hash, business_type.value)
+        # Reattaches to a job already running for this file, so reruns never start a second one
+        result, job = checklist_cache().get_or_start(cache_key, uploaded, business_type, max_items=CHECKLIST_ITEMS)
+
+        if job is not None:
+            progress_bar = st.progress(0.0, text="Labeling transactions...")
+            tally_box = st.empty()
+            preview_box = st.empty()
+
+            while True:
+                finished = job.wait(POLL_INTERVAL)
+                snap = job.snapshot()
+                if snap["preview"]:
+                    preview_box.table([
+                        {"Date": tx.date, "Description": tx.description, "Amount": tx.amount, "Tag": tx.tag}
+                        for tx in snap["preview"]
+                    ])
+                status = f"Labeled {snap['rows']:,} transactions..." if snap["rows"] else "Waiting to start..."
+                progress_bar.progress(snap["progress"], text=status)
+                tally_box.markdown(render_tag_tally(snap["tags"], snap["rows"]))
+                if finished:
+                    break
+
+            if snap["result"] is not None:
+                result = snap["result"]
+                progress_bar.progress(1.0, text="Checklist ready ✅")
             else:
-                st.error("Please enter an email.")
-    if st.button("Start Over"):
-        st.session_state["step"] = "triage"
-        st.session_state["answers"] = {}
-        st.rerun()
+                result = {"error": snap["error"]}
+                progress_bar.empty()
+        else:
+            st.caption("Loaded from cache ⚡")
+
+        if "error" in result:
+            st.error(f"Couldn't read that statement: {result['error']}")
+        else:
+            st.markdown("---")
+            col1, col2, col3 = st.columns(3)
+            col1.metric("Transactions", f"{result['rows']:,}")
+            col2.metric("Findings", f"{result['findings']:,}")
+            col3.metric("Red Flags", f"{result['red_flags']:,}")
+            st.markdown(result["report"])
+            if result["findings"] > CHECKLIST_ITEMS:
+                st.caption(f"Showing the first {CHECKLIST_ITEMS} of {result['findings']:,} findings.")
+            with st.expander("Tag breakdown"):
+                st.markdown(render_tag_tally(result["tags"], result["rows"]))
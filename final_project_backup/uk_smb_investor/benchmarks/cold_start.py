@@ -0,0 +1,114 @@
+"""
+Cold start benchmark for short-lived CLI runs and pool workers.
+
+Each measurement runs in a fresh interpreter, so nothing is already
+imported. Prints a `python -X importtime` profile (heaviest imports
+first) and times a small ledger's label-and-report run against
+COLD_START_BUDGET_S.
+
+    python benchmarks/cold_start.py
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+
+# Seconds from the first engine import to a finished report, best of a few
+# runs. Measured ~105ms, about 2x margin for slower CI machines.
+COLD_START_BUDGET_S = 0.2
+
+# A bare `import uk_smb_engine` must cost at most this fraction of loading
+# every agent and schema up front (what the package did before lazy loading)
+LAZY_IMPORT_MAX_RATIO = 0.1
+
+EAGER_IMPORT = """
+import uk_smb_engine
+for name in uk_smb_engine.__all__:
+    getattr(uk_smb_engine, name)
+"""
+
+# One month for a small consultancy: label it, then build the checklist
+SMALL_LEDGER_RUN = """
+import uk_smb_engine as engine
+ledger = [
+    engine.Transaction(date="2025-03-01", description="Client Retainer", amount=6000.0, type="Income"),
+    engine.Transaction(date="2025-03-02", description="Starbucks", amount=-4.50),
+    engine.Transaction(date="2025-03-05", description="Apple Store", amount=-2000.0),
+    engine.Transaction(date="2025-03-06", description="Xero Subscription", amount=-30.0),
+]
+labeled = engine.SmartLabeler(engine.BusinessType.SERVICE).process(ledger)
+diagnoses, report = engine.build_checklist(engine.BusinessType.SERVICE, labeled)
+"""
+
+TIMED_RUN = """
+import json, sys, time
+start = time.perf_counter()
+exec(compile({code!r}, "<small_ledger>", "exec"))
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "modules": sorted(sys.modules)}}))
+"""
+
+
+def run_fresh(code: str, *flags: str) -> subprocess.CompletedProcess:
+    """Runs `code` in a new interpreter with the engine on the path"""
+    env = dict(os.environ, PYTHONPATH=os.path.abspath(SRC))
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        env=env, capture_output=True, text=True, check=True,
+    )
+
+
+def measure_cold_start(code: str = SMALL_LEDGER_RUN) -> Dict:
+    """Seconds spent importing and running `code` in a fresh interpreter, plus the modules it loaded"""
+    return json.loads(run_fresh(TIMED_RUN.format(code=code)).stdout)
+
+
+def import_profile(code: str) -> List[Tuple[int, int, str]]:
+    """
+    Parses `python -X importtime` output for `code`.
+    Returns (cumulative_us, self_us, module) rows, heaviest first.
+    """
+    rows = []
+    for line in run_fresh(code, "-X", "importtime").stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|")
+        rows.append((int(cumulative_us), int(self_us), module.strip()))
+    return sorted(rows, reverse=True)
+
+
+def print_profile(title: str, code: str, top: int = 15):
+    rows = import_profile(code)
+    print(f"\n--- Import profile: {title} ({len(rows)} modules) ---")
+    print(f"{'cumulative':>12} {'self':>10}  module")
+    for cumulative_us, self_us, module in rows[:top]:
+        print(f"{cumulative_us / 1000:>10.1f}ms {self_us / 1000:>8.1f}ms  {module}")
+
+
+def main(runs: int = 5) -> int:
+    print_profile("import uk_smb_engine", "import uk_smb_engine")
+    print_profile("eager: every agent and schema", EAGER_IMPORT)
+    print_profile("small ledger label + report", SMALL_LEDGER_RUN)
+
+    timings = [measure_cold_start()["seconds"] for _ in range(runs)]
+    best, median = min(timings), statistics.median(timings)
+    print(f"\n--- Cold start: small ledger label + report ({runs} fresh interpreters) ---")
+    print(f"best {best * 1000:.1f}ms | median {median * 1000:.1f}ms | budget {COLD_START_BUDGET_S * 1000:.0f}ms")
+
+    lazy = min(measure_cold_start("import uk_smb_engine")["seconds"] for _ in range(runs))
+    eager = min(measure_cold_start(EAGER_IMPORT)["seconds"] for _ in range(runs))
+    print(f"\n--- Package import: lazy {lazy * 1000:.1f}ms | eager {eager * 1000:.1f}ms | max ratio {LAZY_IMPORT_MAX_RATIO} ---")
+
+    if best > COLD_START_BUDGET_S or lazy > eager * LAZY_IMPORT_MAX_RATIO:
+        print("🛑 Over budget")
+        return 1
+    print("✅ Within budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,56 @@
+"""
+UK SMB Engine.
+
+Agents and schemas are imported lazily on first attribute access, so
+`import uk_smb_engine` stays cheap for CLIs and pool workers that only
+need one agent (pydantic alone is most of the cold start).
+"""
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+# Public name -> module that defines it
+_LAZY_ATTRS = {
+    "BusinessType": ".schemas.models",
+    "Transaction": ".schemas.models",
+    "LabeledTransaction": ".schemas.models",
+    "Diagnosis": ".schemas.models",
+    "AgentState": ".schemas.models",
+    "SmartLabeler": ".agents.labeler",
+    "UKContextTranslator": ".agents.translator",
+    "BottleneckDiagnostician": ".agents.diagnostician",
+    "SimplicityArchitect": ".agents.architect",
+    "MasterInvestorOrchestrator": ".agents.translator_engine",
+    "DiagnosticResult": ".agents.translator_engine",
+    "read_transactions": ".pipeline",
+    "label_statement": ".pipeline",
+    "build_checklist": ".pipeline",
+    "parse_amount": ".pipeline",
+    "statement_worker": ".jobs",
+    "StatementJob": ".jobs",
+    "ChecklistCache": ".jobs",
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+if TYPE_CHECKING:
+    from .schemas.models import BusinessType, Transaction, LabeledTransaction, Diagnosis, AgentState
+    from .agents.labeler import SmartLabeler
+    from .agents.translator import UKContextTranslator
+    from .agents.diagnostician import BottleneckDiagnostician
+    from .agents.architect import SimplicityArchitect
+    from .agents.translator_engine import MasterInvestorOrchestrator, DiagnosticResult
+    from .pipeline import read_transactions, label_statement, build_checklist, parse_amount
+    from .jobs import statement_worker, StatementJob, ChecklistCache
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value  # Cache so __getattr__ only runs once per name
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,6 +1,9 @@
 from typing import List
 from ..schemas.models import LabeledTransaction, Diagnosis, BusinessType
 
+# Personal spend items named in a finding, the rest are counted ("and K more")
+MAX_LISTED_ITEMS = 10
+
 class BottleneckDiagnostician:
     def __init__(self, business_type: BusinessType):
         self.business_type = business_type
@@ -15,7 +18,9 @@ class BottleneckDiagnostician:
         
         # 2. Rule: Compliance Check
         if compliance_risks:
-            items = ", ".join([t.description for t in compliance_risks])
+            items = ", ".join([t.description for t in compliance_risks[:MAX_LISTED_ITEMS]])
+            if len(compliance_risks) > MAX_LISTED_ITEMS:
+                items += f" and {len(compliance_risks) - MAX_LISTED_ITEMS:,} more"
             diagnoses.append(Diagnosis(
                 severity="Warning",
                 title="Personal Spend Detected",
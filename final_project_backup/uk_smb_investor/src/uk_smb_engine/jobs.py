@@ -0,0 +1,154 @@
+import threading
+from collections import Counter, OrderedDict
+from typing import BinaryIO, Dict, Hashable, Optional, Tuple
+
+from .schemas.models import BusinessType
+from .pipeline import DEFAULT_CHUNK_SIZE, LedgerTotals, label_statement, build_checklist
+
+PREVIEW_ROWS = 10
+# Statements labeled at once; later jobs wait their turn
+MAX_RUNNING_JOBS = 2
+
+
+def statement_worker(stream: BinaryIO, business_type: BusinessType, out, cache: Optional["ChecklistCache"] = None,
+                     cache_key: Optional[Hashable] = None, max_items: Optional[int] = None,
+                     chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """
+    Labels a statement and posts its progress to `out` (anything with .put):
+    ("chunk", labeled, progress) per chunk, then ("done", result, 1.0) or
+    ("error", message, None). If `cache` is given, the result (or
+    {"error": message}) is stored under `cache_key` before it is posted.
+    """
+    try:
+        totals = LedgerTotals()
+        tags = Counter()
+        for chunk, progress in label_statement(stream, business_type, chunk_size):
+            totals.add(chunk)
+            tags.update(tx.tag for tx in chunk)
+            out.put(("chunk", chunk, progress))
+
+        diagnoses, report = build_checklist(business_type, totals.transactions(), max_items=max_items)
+        result = {
+            "rows": totals.rows,
+            "tags": dict(tags),
+            "findings": len(diagnoses),
+            "red_flags": sum(1 for d in diagnoses if d.severity in ("Critical", "Warning")),
+            "report": report,
+        }
+    except Exception as e:
+        # The same bytes fail the same way every time, so failures are cached too
+        if cache is not None:
+            cache.store(cache_key, {"error": str(e)})
+        out.put(("error", str(e), None))
+        return
+
+    if cache is not None:
+        cache.store(cache_key, result)
+    out.put(("done", result, 1.0))
+
+
+class StatementJob:
+    """
+    Running totals for one statement being labeled. The worker posts into
+    it and any number of readers (e.g. Streamlit reruns) can attach to it.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._finished = threading.Event()
+        self.rows = 0
+        self.tags = Counter()
+        self.preview = []
+        self.progress = 0.0
+        self.result = None
+        self.error = None
+
+    def put(self, message: Tuple[str, object, Optional[float]]):
+        kind, payload, progress = message
+        with self._lock:
+            if kind == "chunk":
+                if not self.preview:
+                    self.preview = payload[:PREVIEW_ROWS]
+                self.rows += len(payload)
+                self.tags.update(tx.tag for tx in payload)
+            elif kind == "done":
+                self.result = payload
+            else:
+                self.error = payload
+            if progress is not None:
+                self.progress = min(progress, 1.0)
+        if kind != "chunk":
+            self._finished.set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """True once the job has finished, successfully or not"""
+        return self._finished.wait(timeout)
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            return {
+                "rows": self.rows,
+                "tags": dict(self.tags),
+                "preview": list(self.preview),
+                "progress": self.progress,
+                "result": self.result,
+                "error": self.error,
+            }
+
+
+class ChecklistCache:
+    """
+    Finished checklists (least recently used evicted first) plus the jobs
+    still running, keyed e.g. by (file hash, business type). A statement
+    that failed is cached as {"error": message}. At most `max_running` jobs
+    label at once, the rest queue. Safe to share across threads.
+    """
+    def __init__(self, max_entries: int = 32, max_running: int = MAX_RUNNING_JOBS):
+        self.max_entries = max_entries
+        self._running = threading.Semaphore(max_running)
+        self._lock = threading.Lock()
+        self._results = OrderedDict()
+        self._jobs = {}
+
+    def get_or_start(self, key: Hashable, stream: BinaryIO, business_type: BusinessType,
+                     max_items: Optional[int] = None) -> Tuple[Optional[Dict], Optional[StatementJob]]:
+        """
+        Returns (result, None) if the checklist (or its error) is cached,
+        otherwise (None, job) for the job labeling it, starting one only if
+        none is already running for `key`.
+        """
+        with self._lock:
+            if key in self._results:
+                self._results.move_to_end(key)
+                return self._results[key], None
+            job = self._jobs.get(key)
+            if job is None:
+                job = self._jobs[key] = StatementJob()
+                threading.Thread(
+                    target=self._run,
+                    args=(stream, business_type, job, key, max_items),
+                    daemon=True,
+                ).start()
+            return None, job
+
+    def _run(self, stream, business_type, job, key, max_items):
+        with self._running:
+            statement_worker(stream, business_type, job, self, key, max_items)
+
+    def get(self, key: Hashable) -> Optional[Dict]:
+        with self._lock:
+            if key not in self._results:
+                return None
+            self._results.move_to_end(key)
+            return self._results[key]
+
+    def store(self, key: Hashable, result: Dict):
+        with self._lock:
+            self._jobs.pop(key, None)
+            self._results[key] = result
+            self._results.move_to_end(key)
+            while len(self._results) > self.max_entries:
+                self._results.popitem(last=False)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._results)
@@ -0,0 +1,120 @@
+import csv
+import io
+from typing import BinaryIO, Iterator, List, Optional, Tuple
+
+from .schemas.models import Transaction, LabeledTransaction, Diagnosis, BusinessType
+from .agents.labeler import SmartLabeler
+from .agents.translator import UKContextTranslator
+from .agents.diagnostician import BottleneckDiagnostician
+from .agents.architect import SimplicityArchitect
+
+# Rows per chunk. Big enough to keep per-chunk overhead low, small enough
+# that the UI gets a progress update every fraction of a second.
+DEFAULT_CHUNK_SIZE = 5000
+
+REQUIRED_COLUMNS = ("date", "description", "amount")
+
+
+def parse_amount(val: str) -> float:
+    """Parses a money amount like '£1,200.50' or '-$30'. Raises ValueError if it isn't a number."""
+    return float(val.replace(',', '').replace('£', '').replace('$', '').strip())
+
+
+def read_transactions(stream: BinaryIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Tuple[List[Transaction], Optional[float]]]:
+    """
+    Parses a bank statement CSV in chunks of `chunk_size` rows.
+    Yields (transactions, progress) where progress is the fraction of the
+    file consumed so far, or None if the stream cannot report its size.
+    """
+    total = None
+    if stream.seekable():
+        total = stream.seek(0, io.SEEK_END)
+        stream.seek(0)
+
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    try:
+        reader = csv.DictReader(text)
+        headers = {(h or "").strip().lower(): h for h in (reader.fieldnames or [])}
+        missing = [c for c in REQUIRED_COLUMNS if c not in headers]
+        if missing:
+            raise ValueError(f"Statement is missing column(s): {', '.join(missing)}")
+
+        chunk = []
+        for row in reader:
+            try:
+                amount = parse_amount(row[headers["amount"]] or "")
+            except ValueError:
+                raise ValueError(f"Row {reader.line_num}: invalid amount {row[headers['amount']]!r}")
+
+            tx_type = row[headers["type"]] if "type" in headers else None
+            category = row[headers["category"]] if "category" in headers else None
+            chunk.append(Transaction(
+                date=(row[headers["date"]] or "").strip(),
+                description=(row[headers["description"]] or "").strip(),
+                amount=amount,
+                type=tx_type or ("Income" if amount > 0 else "Expense"),
+                category=category or "Uncategorized",
+            ))
+
+            if len(chunk) >= chunk_size:
+                yield chunk, (stream.tell() / total if total else None)
+                chunk = []
+
+        if chunk:
+            yield chunk, (1.0 if total else None)
+    finally:
+        # Hand the stream back to the caller instead of closing it with the wrapper.
+        text.detach()
+
+
+def label_statement(stream: BinaryIO, business_type: BusinessType, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Tuple[List[LabeledTransaction], Optional[float]]]:
+    """
+    Runs the SmartLabeler over a statement chunk by chunk.
+    Raw transactions are dropped as soon as their chunk is labeled.
+    """
+    labeler = SmartLabeler(business_type)
+    for chunk, progress in read_transactions(stream, chunk_size):
+        yield labeler.process(chunk), progress
+
+
+class LedgerTotals:
+    """
+    A labeled statement reduced to what the translator and diagnostician read.
+    Rows they name in a finding are kept one by one; every other row only
+    feeds a sum, so rows sharing a tag, rule and sign are merged into one.
+    Memory then grows with the itemised rows, not with the whole ledger.
+    """
+    ITEMISED_TAGS = ("Compliance_Risk", "Growth_Invest")
+
+    def __init__(self):
+        self.rows = 0
+        self._itemised = []
+        self._merged = {}
+
+    def add(self, chunk: List[LabeledTransaction]):
+        self.rows += len(chunk)
+        for tx in chunk:
+            if any(tag in tx.tag for tag in self.ITEMISED_TAGS):
+                self._itemised.append(tx)
+                continue
+            key = (tx.tag, tx.rule_applied, tx.amount > 0)
+            total = self._merged.get(key)
+            if total is None:
+                self._merged[key] = tx.model_copy(update={"description": f"Total: {tx.rule_applied}"})
+            else:
+                total.amount += tx.amount
+
+    def transactions(self) -> List[LabeledTransaction]:
+        return self._itemised + list(self._merged.values())
+
+
+def build_checklist(business_type: BusinessType, labeled: List[LabeledTransaction], max_items: Optional[int] = None) -> Tuple[List[Diagnosis], str]:
+    """
+    Runs Translator -> Diagnostician -> Architect over the labeled statement.
+    Returns all diagnoses and the Monday Morning Checklist, which lists at
+    most `max_items` of them (large statements can produce thousands).
+    """
+    diagnoses = []
+    diagnoses.extend(UKContextTranslator(business_type).analyze(labeled))
+    diagnoses.extend(BottleneckDiagnostician(business_type).diagnose(labeled))
+    return diagnoses, SimplicityArchitect().generate_report(diagnoses[:max_items])
@@ -0,0 +1,12 @@
+import io
+
+# Mike the Plumber's month, as statement CSV rows
+PLUMBER_ROWS = (
+    "2025-01,Big Job Payment,10000",
+    "2025-01,Screwfix Direct,-450",
+    "2025-01,Van Lease,-350",
+)
+
+def make_statement(*rows, header="Date,Description,Amount"):
+    """An in-memory CSV upload"""
+    return io.BytesIO("\n".join([header, *rows]).encode("utf-8"))
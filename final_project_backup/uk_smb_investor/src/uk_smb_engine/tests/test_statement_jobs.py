@@ -0,0 +1,147 @@
+import io
+import queue
+import threading
+import unittest
+from uk_smb_engine.schemas.models import BusinessType
+from uk_smb_engine.jobs import statement_worker, StatementJob, ChecklistCache
+from statement_fixtures import PLUMBER_ROWS, make_statement
+
+def drain(out):
+    messages = []
+    while not out.empty():
+        messages.append(out.get_nowait())
+    return messages
+
+class GatedStatement(io.BytesIO):
+    """Blocks the first read until `gate` is set, so a job stays in flight"""
+    def __init__(self, data):
+        super().__init__(data)
+        self.gate = threading.Event()
+
+    def read1(self, *args):
+        self.gate.wait(5)
+        return super().read1(*args)
+
+    def read(self, *args):
+        self.gate.wait(5)
+        return super().read(*args)
+
+class TestStatementWorker(unittest.TestCase):
+
+    def test_posts_chunks_then_done_and_caches(self):
+        out, cache = queue.Queue(), ChecklistCache()
+        statement_worker(make_statement(*PLUMBER_ROWS), BusinessType.TRADE, out, cache, "plumber", chunk_size=2)
+
+        messages = drain(out)
+        self.assertEqual([kind for kind, _, _ in messages], ["chunk", "chunk", "done"])
+        self.assertEqual([len(payload) for kind, payload, _ in messages[:2]], [2, 1])
+        result = messages[-1][1]
+        self.assertEqual(result["rows"], 3)
+        self.assertIn("VAT Cash Accounting Scheme", result["report"])
+        self.assertIs(cache.get("plumber"), result)
+
+    def test_bad_csv_posts_error_and_caches_it(self):
+        out, cache = queue.Queue(), ChecklistCache()
+        statement_worker(make_statement("2025-01,Fee,lots"), BusinessType.TRADE, out, cache, "bad")
+
+        (kind, payload, progress), = drain(out)
+        self.assertEqual(kind, "error")
+        self.assertIn("invalid amount", payload)
+        self.assertIsNone(progress)
+        self.assertEqual(cache.get("bad"), {"error": payload})
+
+class TestChecklistCache(unittest.TestCase):
+
+    def test_evicts_oldest_first(self):
+        cache = ChecklistCache(max_entries=2)
+        for key in ("a", "b", "c"):
+            cache.store(key, {"rows": key})
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("c"), {"rows": "c"})
+
+    def test_hits_keep_entries_alive(self):
+        """A statement that keeps being re-uploaded outlives newer one-off uploads"""
+        cache = ChecklistCache(max_entries=2)
+        cache.store("regular", {"rows": 1})
+        cache.store("one_off_1", {"rows": 2})
+        cache.get("regular")
+        cache.store("one_off_2", {"rows": 3})
+        self.assertIsNone(cache.get("one_off_1"))
+
+        cached, _ = cache.get_or_start("regular", make_statement(*PLUMBER_ROWS), BusinessType.TRADE)
+        cache.store("one_off_3", {"rows": 4})
+        self.assertEqual(cached, {"rows": 1})
+        self.assertEqual(cache.get("regular"), {"rows": 1})
+        self.assertIsNone(cache.get("one_off_2"))
+
+    def test_concurrent_stores_stay_bounded(self):
+        cache = ChecklistCache(max_entries=4)
+        threads = [threading.Thread(target=cache.store, args=(i, {})) for i in range(200)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(len(cache), 4)
+
+    def test_rerun_reattaches_to_running_job(self):
+        """A second request for the same key while labeling must not start another worker"""
+        cache = ChecklistCache()
+        stream = GatedStatement(make_statement(*PLUMBER_ROWS).getvalue())
+
+        result, job = cache.get_or_start("plumber", stream, BusinessType.TRADE)
+        self.assertIsNone(result)
+        again_result, again_job = cache.get_or_start("plumber", make_statement(*PLUMBER_ROWS), BusinessType.TRADE)
+        self.assertIsNone(again_result)
+        self.assertIs(again_job, job)
+
+        stream.gate.set()
+        self.assertTrue(job.wait(5))
+        snap = job.snapshot()
+        self.assertEqual(snap["rows"], 3)
+        self.assertEqual(snap["progress"], 1.0)
+        self.assertEqual(len(snap["preview"]), 3)
+
+        cached, no_job = cache.get_or_start("plumber", stream, BusinessType.TRADE)
+        self.assertIs(cached, snap["result"])
+        self.assertIsNone(no_job)
+
+    def test_failed_statement_is_not_labeled_again(self):
+        """Reruns with the same bad file get the cached error instead of a new job"""
+        cache = ChecklistCache()
+        _, job = cache.get_or_start("bad", make_statement("2025-01,Fee,lots"), BusinessType.TRADE)
+        self.assertTrue(job.wait(5))
+        self.assertIsNone(job.snapshot()["result"])
+
+        cached, no_job = cache.get_or_start("bad", make_statement("2025-01,Fee,lots"), BusinessType.TRADE)
+        self.assertIsNone(no_job)
+        self.assertIn("invalid amount", cached["error"])
+
+    def test_running_jobs_are_capped(self):
+        """With one slot, a second statement waits until the first is done"""
+        cache = ChecklistCache(max_running=1)
+        first = GatedStatement(make_statement(*PLUMBER_ROWS).getvalue())
+        _, first_job = cache.get_or_start("first", first, BusinessType.TRADE)
+        _, second_job = cache.get_or_start("second", make_statement(*PLUMBER_ROWS), BusinessType.TRADE)
+
+        self.assertFalse(second_job.wait(0.3))
+        self.assertEqual(second_job.snapshot()["rows"], 0)
+
+        first.gate.set()
+        self.assertTrue(first_job.wait(5))
+        self.assertTrue(second_job.wait(5))
+        self.assertEqual(second_job.snapshot()["result"]["rows"], 3)
+
+class TestStatementJob(unittest.TestCase):
+
+    def test_folds_messages(self):
+        job = StatementJob()
+        job.put(("chunk", [], 0.5))
+        self.assertFalse(job.wait(0))
+        self.assertEqual(job.snapshot()["progress"], 0.5)
+        job.put(("done", {"rows": 0}, 1.0))
+        self.assertTrue(job.wait(0))
+        self.assertEqual(job.snapshot()["result"], {"rows": 0})
+
+if __name__ == '__main__':
+    unittest.main()
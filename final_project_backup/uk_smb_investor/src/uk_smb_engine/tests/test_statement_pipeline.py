@@ -0,0 +1,100 @@
+import unittest
+from uk_smb_engine.schemas.models import BusinessType
+from uk_smb_engine.pipeline import read_transactions, label_statement, build_checklist, parse_amount, LedgerTotals
+from statement_fixtures import PLUMBER_ROWS, make_statement
+
+class TestStatementPipeline(unittest.TestCase):
+
+    def test_reads_in_chunks_with_progress(self):
+        """250 rows in chunks of 100 -> 100, 100, 50 and progress ending at 1.0"""
+        stream = make_statement(*[f"2025-01-{i % 28 + 1:02d},Client Fee,100" for i in range(250)])
+        chunks = list(read_transactions(stream, chunk_size=100))
+
+        self.assertEqual([len(c) for c, _ in chunks], [100, 100, 50])
+        progress = [p for _, p in chunks]
+        self.assertEqual(progress, sorted(progress))
+        self.assertEqual(progress[-1], 1.0)
+        self.assertFalse(stream.closed) # Caller still owns the stream
+
+    def test_cleans_amounts_and_infers_type(self):
+        stream = make_statement('2025-01-01,Big Job,"£10,000.00"', "2025-01-02,Screwfix,-450")
+        (chunk, _), = read_transactions(stream)
+
+        self.assertEqual(chunk[0].amount, 10000.0)
+        self.assertEqual(chunk[0].type, "Income")
+        self.assertEqual(chunk[1].type, "Expense")
+
+    def test_rejects_bad_statements(self):
+        with self.assertRaises(ValueError):
+            list(read_transactions(make_statement("2025-01-01,Fee", header="Date,Description")))
+        with self.assertRaises(ValueError):
+            list(read_transactions(make_statement("2025-01-01,Fee,lots")))
+
+    def test_statement_to_checklist(self):
+        """Mike the Plumber, uploaded as a CSV"""
+        stream = make_statement(*PLUMBER_ROWS)
+        labeled = [tx for chunk, _ in label_statement(stream, BusinessType.TRADE, chunk_size=2) for tx in chunk]
+        tags = {t.description: t.tag for t in labeled}
+        self.assertIn("COGS", tags["Screwfix Direct"])
+
+        diagnoses, report = build_checklist(BusinessType.TRADE, labeled)
+        titles = [d.title for d in diagnoses]
+        self.assertIn("VAT Cash Accounting Scheme", titles)
+        self.assertIn("VAT Threshold Breached", report)
+
+        _, short_report = build_checklist(BusinessType.TRADE, labeled, max_items=1)
+        self.assertNotIn("2. ", short_report)
+
+    def test_report_size_is_bounded_on_large_statements(self):
+        """20k rows, 1 in 5 Starbucks: reasons listing every match must not leak into the checklist"""
+        descriptions = ["Starbucks", "Client Fee", "Apple Store", "Xero", "Laptop"]
+        amounts = ["-4.5", "600", "-2000", "-30", "-900"]
+        stream = make_statement(*[f"2025-01-01,{descriptions[i % 5]} #{i},{amounts[i % 5]}" for i in range(20000)])
+        labeled = [tx for chunk, _ in label_statement(stream, BusinessType.SERVICE) for tx in chunk]
+
+        diagnoses, report = build_checklist(BusinessType.SERVICE, labeled, max_items=50)
+        self.assertGreater(len(diagnoses), 5000)
+        self.assertLess(len(report), 50 * 600)
+        self.assertIn("and 3,990 more", report)
+
+    def test_personal_spend_count_with_commas_in_descriptions(self):
+        stream = make_statement(*['2025-01,"Pret, Oxford St",-6' for _ in range(35)], "2025-01,Client Fee,6000")
+        labeled = [tx for chunk, _ in label_statement(stream, BusinessType.SERVICE) for tx in chunk]
+
+        diagnoses, _ = build_checklist(BusinessType.SERVICE, labeled)
+        reason, = [d.reason for d in diagnoses if d.title == "Personal Spend Detected"]
+        self.assertTrue(reason.endswith("Pret, Oxford St and 25 more"))
+
+    def test_ledger_totals_give_the_same_checklist(self):
+        """Merged totals must diagnose exactly like the full ledger"""
+        rows = ["2025-01,Client Retainer,700", "2025-01,Starbucks,-4.5", "2025-01,Apple Store,-2000",
+                "2025-01,Xero,-30", "2025-01,Screwfix Direct,-450", "2025-01,Shell Petrol,-80",
+                "2025-01,Van Lease,-350", "2025-01,Gym,-40", "2025-01,Big Job Payment,900"]
+        for business_type in BusinessType:
+            labeled, totals = [], LedgerTotals()
+            for chunk, _ in label_statement(make_statement(*rows * 200), business_type, chunk_size=250):
+                labeled.extend(chunk)
+                totals.add(chunk)
+
+            self.assertEqual(totals.rows, len(labeled))
+            self.assertLess(len(totals.transactions()), len(labeled))
+            full = build_checklist(business_type, labeled)
+            compact = build_checklist(business_type, totals.transactions())
+            self.assertEqual(compact[1], full[1])
+
+    def test_ledger_totals_stay_small_without_itemised_rows(self):
+        totals = LedgerTotals()
+        stream = make_statement(*["2025-01,Client Fee,600", "2025-01,Xero,-30"] * 10000)
+        for chunk, _ in label_statement(stream, BusinessType.SERVICE):
+            totals.add(chunk)
+        self.assertEqual(totals.rows, 20000)
+        self.assertEqual(len(totals.transactions()), 2)
+
+    def test_parse_amount(self):
+        self.assertEqual(parse_amount(" £1,200.50 "), 1200.5)
+        self.assertEqual(parse_amount("-$30"), -30.0)
+        with self.assertRaises(ValueError):
+            parse_amount("")
+
+if __name__ == '__main__':
+    unittest.main()
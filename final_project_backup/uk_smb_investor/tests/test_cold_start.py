@@ -0,0 +1,44 @@
+import os
+import sys
+import pytest
+
+# Benchmarks aren't a package; add them to the path like the app does with src
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'benchmarks'))
+from cold_start import COLD_START_BUDGET_S, LAZY_IMPORT_MAX_RATIO, EAGER_IMPORT, measure_cold_start, import_profile
+
+import uk_smb_engine
+
+def test_package_import_is_lazy():
+    """`import uk_smb_engine` alone must not pull in pydantic or any agent"""
+    modules = measure_cold_start("import uk_smb_engine")["modules"]
+    assert "pydantic" not in modules
+    assert not [m for m in modules if m.startswith("uk_smb_engine.")]
+
+def test_lazy_import_beats_eager_baseline():
+    """Fails if the package goes back to importing its agents up front"""
+    lazy = min(measure_cold_start("import uk_smb_engine")["seconds"] for _ in range(3))
+    eager = min(measure_cold_start(EAGER_IMPORT)["seconds"] for _ in range(3))
+    assert lazy < eager * LAZY_IMPORT_MAX_RATIO, f"Lazy import {lazy * 1000:.1f}ms vs eager {eager * 1000:.1f}ms"
+
+def test_only_the_agent_you_touch_is_loaded():
+    modules = measure_cold_start("import uk_smb_engine; uk_smb_engine.SmartLabeler")["modules"]
+    assert "uk_smb_engine.agents.labeler" in modules
+    assert "uk_smb_engine.agents.diagnostician" not in modules
+    assert "uk_smb_engine.agents.translator_engine" not in modules
+
+def test_lazy_attributes():
+    from uk_smb_engine.agents.labeler import SmartLabeler
+    assert uk_smb_engine.SmartLabeler is SmartLabeler
+    assert "SmartLabeler" in dir(uk_smb_engine)
+    with pytest.raises(AttributeError):
+        uk_smb_engine.NotAnAgent
+
+def test_import_profile_lists_engine():
+    modules = [module for _, _, module in import_profile("import uk_smb_engine.agents.labeler")]
+    assert "uk_smb_engine.agents.labeler" in modules
+    assert "pydantic" in modules
+
+def test_small_ledger_cold_start_budget():
+    """Label + report for a small ledger, best of 3 fresh interpreters"""
+    best = min(measure_cold_start()["seconds"] for _ in range(3))
+    assert best < COLD_START_BUDGET_S, f"Cold start {best * 1000:.0f}ms over {COLD_START_BUDGET_S * 1000:.0f}ms budget"